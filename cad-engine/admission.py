@@ -0,0 +1,122 @@
+"""
+Adaptive admission control for conversions
+
+Adjusts how many conversions may run at once from observed conversion times
+using additive-increase / multiplicative-decrease (AIMD)
+"""
+
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """
+    AIMD limit on in-flight conversions
+
+    After each conversion the rolling mean of the last `window` conversion
+    times is compared with the target: at or below it the limit grows by
+    `increase`, above it (or on failure) the limit is multiplied by `decrease`.
+    Requests over the current limit wait for a slot.
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: float,
+        min_concurrency: float,
+        max_concurrency: float,
+        target_latency_seconds: float,
+        window: int = 32,
+        increase: float = 0.5,
+        decrease: float = 0.5
+    ):
+        """
+        Initialize admission controller
+
+        Args:
+            initial_concurrency: Starting in-flight limit
+            min_concurrency: Lower bound for the limit
+            max_concurrency: Upper bound for the limit
+            target_latency_seconds: Target rolling mean conversion time
+            window: Number of recent conversion times averaged
+            increase: Additive step applied while under target
+            decrease: Multiplicative factor applied on overshoot or failure
+        """
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency_seconds = target_latency_seconds
+        self.increase = increase
+        self.decrease = decrease
+        self.concurrency = min(max(initial_concurrency, min_concurrency), max_concurrency)
+
+        self._latencies: deque = deque(maxlen=window)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+        logger.info(
+            "AdmissionController initialized (limit: %s, range: %s-%s, target: %ss)",
+            self.concurrency, min_concurrency, max_concurrency, target_latency_seconds
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current whole number of conversions allowed in flight"""
+        return max(1, int(self.concurrency))
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Wait for a conversion slot and record the conversion time on exit
+
+        An exception raised inside the block counts as a failure; a cancelled
+        block frees its slot without affecting the limit, since its partial
+        time says nothing about conversion latency
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        started = time.monotonic()
+        failed = False
+        cancelled = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        except BaseException:
+            cancelled = True
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            async with self._condition:
+                self._in_flight -= 1
+                if not cancelled:
+                    self._record(elapsed, failed)
+                self._condition.notify_all()
+
+    def _record(self, elapsed: float, failed: bool) -> None:
+        """Apply the AIMD update for one completed conversion"""
+        if not failed:
+            self._latencies.append(elapsed)
+
+        mean_latency = sum(self._latencies) / len(self._latencies) if self._latencies else 0.0
+
+        if failed or mean_latency > self.target_latency_seconds:
+            self.concurrency = max(self.min_concurrency, self.concurrency * self.decrease)
+        else:
+            self.concurrency = min(self.max_concurrency, self.concurrency + self.increase)
+
+    def stats(self) -> Dict:
+        """Current limiter state for health reporting"""
+        return {
+            "concurrency_limit": self.limit,
+            "concurrency": round(self.concurrency, 2),
+            "in_flight": self._in_flight
+        }
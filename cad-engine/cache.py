@@ -0,0 +1,147 @@
+"""
+Converted STL cache
+
+Stores conversion results on disk keyed by a content hash of the uploaded
+STEP file, so repeated uploads skip the OCCT pipeline entirely
+"""
+
+import os
+import logging
+import threading
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class StlCache:
+    """
+    Size-capped LRU cache of STL files
+
+    Entries are hard links, so storing and serving a result never copies
+    file data. The cache directory must be on the same filesystem as the
+    temp directory. Recency is tracked through file modification times.
+
+    The total size is counted by evict() at startup and then kept as a
+    running total of this process's stores, so the directory is only
+    rescanned when that total passes the cap. Other processes sharing the
+    directory keep their own totals, so the cap is approximate between scans.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize STL cache
+
+        Args:
+            cache_dir: Directory holding cached STL files
+            max_bytes: Total size cap; 0 disables the cache
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        logger.info("StlCache initialized (dir: %s, max bytes: %s)", cache_dir, max_bytes)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all"""
+        return self.max_bytes > 0
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".stl")
+
+    def link_into(self, key: str, stl_file_path: str) -> Optional[os.stat_result]:
+        """
+        Hard link a cached STL to the given path
+
+        Args:
+            key: Cache key
+            stl_file_path: Destination path (must not exist)
+
+        Returns:
+            Stat result of the linked STL, or None on a cache miss
+        """
+        if not self.enabled:
+            return None
+
+        entry_path = self._entry_path(key)
+        try:
+            os.link(entry_path, stl_file_path)
+            os.utime(entry_path)
+            return os.stat(stl_file_path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("STL cache lookup failed for %s: %s", key, e)
+            return None
+
+    def store(self, key: str, stl_file_path: str) -> None:
+        """
+        Add a converted STL to the cache, evicting once it grows past the size cap
+
+        Args:
+            key: Cache key
+            stl_file_path: Path to the converted STL
+        """
+        if not self.enabled:
+            return
+
+        try:
+            os.link(stl_file_path, self._entry_path(key))
+            size = os.stat(stl_file_path).st_size
+        except FileExistsError:
+            return
+        except OSError as e:
+            logger.warning("STL cache store failed for %s: %s", key, e)
+            return
+
+        with self._lock:
+            self._total_bytes += size
+            over_cap = self._total_bytes > self.max_bytes
+
+        if over_cap:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits its size cap
+
+        Scans the whole cache directory and resets the running total
+        """
+        if not self.enabled:
+            return
+
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        if total_size <= self.max_bytes:
+            with self._lock:
+                self._total_bytes = total_size
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            if total_size <= self.max_bytes:
+                break
+
+        with self._lock:
+            self._total_bytes = total_size
+
+        logger.info("STL cache evicted down to %s bytes", total_size)
@@ -6,7 +6,59 @@ Centralized configuration with environment variable validation
 
 import os
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
+
+
+def cgroup_cpu_quota() -> Optional[float]:
+    """
+    CPU limit imposed through cgroups (e.g. docker --cpus or compose cpus)
+    
+    Returns:
+        Number of CPUs the quota allows, or None if unlimited or unknown
+    """
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    
+    try:
+        # cgroup v1: quota of -1 means unlimited
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        if quota <= 0:
+            return None
+        return quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may actually use
+    
+    Unlike os.cpu_count(), honors the scheduler affinity mask and a cgroup CPU
+    quota, so a container limited to 2 CPUs on a 16-core host reports 2
+    
+    Returns:
+        Usable CPU count (at least 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    
+    quota = cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, int(quota))
+    
+    return max(1, cpus)
 
 
 @dataclass
@@ -17,21 +69,35 @@ class AppConfig:
     port: int
     host: str
     environment: str
+    workers: int
+    cpus: int
     
     # Security
     cors_origins: List[str]
     max_file_size_bytes: int
     rate_limit_per_minute: int
+    max_concurrent_per_client: int
+    concurrency_ttl_seconds: int
+    redis_url: str
+    single_node: bool
     
     # Conversion settings
     linear_deflection: float
     angular_deflection: float
+    linear_relative_deflection: float
+    conversion_workers: int
+    max_inflight_conversions: int
+    target_conversion_seconds: float
+    mesh_parallel: bool
     
     # Storage
     temp_dir: str
+    cache_dir: str
+    cache_max_bytes: int
     
     # Logging
     log_level: str
+    log_format: str
     
     @classmethod
     def from_env(cls) -> 'AppConfig':
@@ -48,6 +114,7 @@ class AppConfig:
         # Parse conversion settings
         linear_deflection = float(os.getenv("LINEAR_DEFLECTION", "0.1"))
         angular_deflection = float(os.getenv("ANGULAR_DEFLECTION", "0.5"))
+        linear_relative_deflection = float(os.getenv("LINEAR_RELATIVE_DEFLECTION", "0.001"))
         
         # Validate deflection values
         if not (0.001 <= linear_deflection <= 1.0):
@@ -56,23 +123,81 @@ class AppConfig:
         if not (0.1 <= angular_deflection <= 1.0):
             raise ValueError(f"ANGULAR_DEFLECTION must be between 0.1 and 1.0, got {angular_deflection}")
         
+        if not (0.0 <= linear_relative_deflection <= 0.1):
+            raise ValueError(
+                f"LINEAR_RELATIVE_DEFLECTION must be between 0 and 0.1, got {linear_relative_deflection}"
+            )
+        
+        # Parse process counts: uvicorn workers default to one per CPU, and each
+        # gets an equal share of the CPUs for its conversion pool. CPUS overrides
+        # the detected count (which already honors container CPU limits).
+        # Without Redis, rate limit counters are per process, so a single
+        # worker is the default to keep RATE_LIMIT_PER_MINUTE exact
+        cpu_count = int(os.getenv("CPUS", "0")) or available_cpus()
+        redis_url = os.getenv("REDIS_URL", "")
+        workers = int(os.getenv("WORKERS", "0")) or (cpu_count if redis_url else 1)
+        conversion_workers = int(
+            os.getenv("CONVERSION_WORKERS", str(max(1, cpu_count // workers)))
+        )
+        
+        # Converted STLs are cached next to temp files so they can be hard linked
+        temp_dir = os.getenv("TMPDIR", "/tmp/cad-files")
+        
+        # Per-request info logs are only emitted by default outside production,
+        # where logs are JSON lines for the log collector
+        environment = os.getenv("NODE_ENV", "development")
+        is_production = environment.lower() == "production"
+        default_log_level = "warning" if is_production else "info"
+        default_log_format = "json" if is_production else "text"
+        
         return cls(
             port=int(os.getenv("PORT", "5000")),
             host=os.getenv("HOST", "0.0.0.0"),
-            environment=os.getenv("NODE_ENV", "development"),
+            environment=environment,
+            workers=workers,
+            cpus=cpu_count,
             cors_origins=cors_origins,
             max_file_size_bytes=max_file_size_bytes,
             rate_limit_per_minute=int(os.getenv("RATE_LIMIT_PER_MINUTE", "10")),
+            max_concurrent_per_client=int(os.getenv("MAX_CONCURRENT_PER_CLIENT", "2")),
+            concurrency_ttl_seconds=int(os.getenv("CONCURRENCY_TTL_SECONDS", "300")),
+            redis_url=redis_url,
+            single_node=os.getenv("SINGLE_NODE", "true").lower() == "true",
             linear_deflection=linear_deflection,
             angular_deflection=angular_deflection,
-            temp_dir=os.getenv("TMPDIR", "/tmp/cad-files"),
-            log_level=os.getenv("LOG_LEVEL", "info").upper()
+            linear_relative_deflection=linear_relative_deflection,
+            conversion_workers=conversion_workers,
+            max_inflight_conversions=int(
+                os.getenv("MAX_INFLIGHT_CONVERSIONS", str(conversion_workers * 2))
+            ),
+            target_conversion_seconds=float(os.getenv("TARGET_CONVERSION_SECONDS", "10")),
+            mesh_parallel=os.getenv("MESH_PARALLEL", "true").lower() == "true",
+            temp_dir=temp_dir,
+            cache_dir=os.getenv("STL_CACHE_DIR", os.path.join(temp_dir, "stl-cache")),
+            cache_max_bytes=int(os.getenv("STL_CACHE_MAX_MB", "1024")) * 1024 * 1024,
+            log_level=os.getenv("LOG_LEVEL", default_log_level).upper(),
+            log_format=os.getenv("LOG_FORMAT", default_log_format).lower()
         )
     
     def is_production(self) -> bool:
         """Check if running in production mode"""
         return self.environment.lower() == "production"
     
+    def rate_limit_storage_uri(self) -> str:
+        """
+        Rate limit counter storage
+        
+        In-process for a single node served by one process; counters must be
+        shared through Redis once several uvicorn workers or nodes serve traffic
+        """
+        if not self.redis_url or (self.single_node and self.workers == 1):
+            return "memory://"
+        return self.redis_url
+    
+    def mesh_threads_per_worker(self) -> int:
+        """Meshing threads each conversion worker may use without oversubscribing CPUs"""
+        return max(1, self.cpus // (self.workers * self.conversion_workers))
+    
     def validate(self) -> None:
         """Validate configuration values"""
         if self.port < 1 or self.port > 65535:
@@ -84,5 +209,32 @@ class AppConfig:
         if self.rate_limit_per_minute < 1:
             raise ValueError("RATE_LIMIT_PER_MINUTE must be at least 1")
         
+        if self.max_inflight_conversions < 1:
+            raise ValueError("MAX_INFLIGHT_CONVERSIONS must be at least 1")
+        
+        if self.target_conversion_seconds <= 0:
+            raise ValueError("TARGET_CONVERSION_SECONDS must be positive")
+        
+        if self.max_concurrent_per_client < 0:
+            raise ValueError("MAX_CONCURRENT_PER_CLIENT cannot be negative")
+        
+        if self.concurrency_ttl_seconds < 1:
+            raise ValueError("CONCURRENCY_TTL_SECONDS must be at least 1")
+        
+        if self.workers < 1:
+            raise ValueError("WORKERS must be at least 1")
+        
+        if self.cpus < 1:
+            raise ValueError("CPUS must be at least 1")
+        
+        if self.conversion_workers < 1:
+            raise ValueError("CONVERSION_WORKERS must be at least 1")
+        
+        if self.cache_max_bytes < 0:
+            raise ValueError("STL_CACHE_MAX_MB cannot be negative")
+        
+        if self.log_format not in ("json", "text"):
+            raise ValueError(f"LOG_FORMAT must be 'json' or 'text', got {self.log_format}")
+        
         if not self.cors_origins:
             raise ValueError("CORS_ORIGINS cannot be empty")
@@ -0,0 +1,41 @@
+"""
+Structured log formatting
+
+Renders log records as single-line JSON objects with orjson, including any
+fields passed through the `extra` argument of a logging call
+"""
+
+import logging
+
+import orjson
+
+
+# Attributes every LogRecord carries; anything else on a record came from `extra`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats log records as JSON lines
+
+    Each line holds the timestamp, level, logger name and message, followed
+    by the record's extra fields. Values orjson cannot serialize are
+    rendered with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+
+        return orjson.dumps(entry, default=str).decode()
@@ -9,26 +9,41 @@ Standards: ISO 10303 (STEP), STL Binary Format
 """
 
 import os
+import asyncio
+import hashlib
 import logging
-import tempfile
+import multiprocessing
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, Optional
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from anyio import to_thread
 from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+import redis.asyncio as aioredis
+import orjson
+import pybase64
 import uvicorn
+from uvicorn.config import LOGGING_CONFIG
 
 from config import AppConfig
-from services import StepReader, ShapeMesher, StlWriter, ConversionService
+from services import init_worker, convert_in_worker, read_mesh_header, ConversionResult
 from validators import FileValidator
+from cache import StlCache
+from storage import create_temp_file, name_temp_file, is_tmpfs
+from middleware import ConcurrencyLimiter, ContentLengthLimiter, RateLimitHeaders, client_ip
+from admission import AdmissionController
+from log_format import JsonFormatter
 from exceptions import (
     CADEngineException,
     FileValidationError,
+    FileSizeExceededError,
     ConversionError
 )
 
@@ -40,31 +55,110 @@ from exceptions import (
 config = AppConfig.from_env()
 config.validate()
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: JSON lines carrying `extra` fields, or plain text for development
+log_handler = logging.StreamHandler()
+if config.log_format == "json":
+    log_handler.setFormatter(JsonFormatter())
+else:
+    log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=getattr(logging, config.log_level), handlers=[log_handler])
 logger = logging.getLogger(__name__)
 
 # Log startup configuration (sanitized)
-logger.info(f"Starting CAD Engine in {config.environment} mode")
-logger.info(f"Port: {config.port}")
-logger.info(f"Max file size: {config.max_file_size_bytes / (1024 * 1024):.2f}MB")
-logger.info(f"Rate limit: {config.rate_limit_per_minute} requests/minute")
-logger.info(f"CORS origins: {config.cors_origins}")
+logger.info("Starting CAD Engine in %s mode", config.environment)
+logger.info("Port: %s", config.port)
+logger.info("Workers: %s", config.workers)
+logger.info("Max file size: %.2fMB", config.max_file_size_bytes / (1024 * 1024))
+logger.info("Rate limit: %s requests/minute", config.rate_limit_per_minute)
+if config.workers > 1 and config.rate_limit_storage_uri() == "memory://":
+    logger.warning(
+        "Rate limit counters are per worker without REDIS_URL - "
+        "%s workers allow up to %s requests/minute per client",
+        config.workers, config.workers * config.rate_limit_per_minute
+    )
+logger.info("Concurrency limit: %s conversions/client (0 = disabled)", config.max_concurrent_per_client)
+logger.info("CORS origins: %s", config.cors_origins)
 
 # ============================================================================
 # RATE LIMITING
 # ============================================================================
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Initialize rate limiter (in-process counters unless shared Redis storage is needed).
+# If Redis is unreachable, limits fall back to per-process memory instead of
+# failing every request; slowapi probes Redis periodically and switches back.
+# With Redis storage each rate limited request makes a blocking Redis call
+# from slowapi on the event loop.
+limiter = Limiter(
+    key_func=client_ip,
+    storage_uri=config.rate_limit_storage_uri(),
+    in_memory_fallback_enabled=True,
+    swallow_errors=True
+)
+
+# Shared by both conversion endpoints; slowapi still parses it on each request
+CONVERSION_RATE_LIMIT = f"{config.rate_limit_per_minute}/minute"
+
+# ============================================================================
+# HTTP CACHING
+# ============================================================================
+
+# An STL is a pure function of the STEP content and these mesh settings, so
+# together with the content hash they form both the cache key and the ETag
+MESH_SETTINGS_TAG = (
+    f"{config.linear_deflection:.6g}-{config.angular_deflection:.6g}"
+    f"-{config.linear_relative_deflection:.6g}"
+)
+STL_CACHE_CONTROL = "public, max-age=86400, immutable"
 
 # ============================================================================
 # APPLICATION LIFECYCLE
 # ============================================================================
 
+def create_conversion_pool() -> ProcessPoolExecutor:
+    """
+    Create the process pool that runs OCCT conversions
+    
+    OCCT meshing is CPU-bound, so conversions run in worker processes.
+    Workers are spawned rather than forked because the event loop process
+    already runs threads; each worker builds its own conversion service once.
+    
+    Returns:
+        Process pool with initialized conversion workers
+    """
+    return ProcessPoolExecutor(
+        max_workers=config.conversion_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(
+            config.linear_deflection,
+            config.angular_deflection,
+            config.linear_relative_deflection,
+            config.mesh_parallel,
+            config.mesh_threads_per_worker()
+        )
+    )
+
+
+def replace_conversion_pool(app: FastAPI, broken_pool: ProcessPoolExecutor) -> None:
+    """
+    Swap a broken conversion pool for a fresh one
+    
+    A worker that dies (e.g. OCCT segfaults on a malformed file) leaves its
+    ProcessPoolExecutor unable to run further jobs. Concurrent requests that
+    saw the same crash only replace the pool once.
+    
+    Args:
+        app: FastAPI application holding the pool in app.state
+        broken_pool: Pool that raised BrokenProcessPool
+    """
+    if app.state.conversion_pool is not broken_pool:
+        return
+    
+    app.state.conversion_pool = create_conversion_pool()
+    broken_pool.shutdown(wait=False, cancel_futures=True)
+    logger.warning("Conversion pool restarted after a worker crash")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager - handles startup and shutdown"""
@@ -74,21 +168,18 @@ async def lifespan(app: FastAPI):
     
     # Create temp directory if it doesn't exist
     os.makedirs(config.temp_dir, exist_ok=True)
-    logger.info(f"Temp directory: {config.temp_dir}")
-    
-    # Initialize services with dependency injection
-    step_reader = StepReader()
-    shape_mesher = ShapeMesher(
-        linear_deflection=config.linear_deflection,
-        angular_deflection=config.angular_deflection
-    )
-    stl_writer = StlWriter(ascii_mode=False)  # Binary STL for smaller files
+    logger.info("Temp directory: %s", config.temp_dir)
+    # Informational only: the STL cache defaults to a subdirectory of the temp
+    # directory (hard links need one filesystem), so moving it to tmpfs also
+    # puts up to STL_CACHE_MAX_MB of cache in RAM
+    if not is_tmpfs(config.temp_dir):
+        logger.info("Temp directory is not on tmpfs - uploads and STL output will hit disk")
     
-    # Create conversion service
-    conversion_service = ConversionService(
-        step_reader=step_reader,
-        shape_mesher=shape_mesher,
-        stl_writer=stl_writer
+    # Run conversions in a pool of worker processes
+    conversion_pool = create_conversion_pool()
+    logger.info(
+        "Conversion pool: %s worker processes, %s mesh threads each",
+        config.conversion_workers, config.mesh_threads_per_worker()
     )
     
     # Create file validator
@@ -96,8 +187,31 @@ async def lifespan(app: FastAPI):
         max_file_size_bytes=config.max_file_size_bytes
     )
     
+    # Adapt in-flight conversions to observed conversion time (AIMD)
+    admission = AdmissionController(
+        initial_concurrency=config.conversion_workers,
+        min_concurrency=1,
+        max_concurrency=config.max_inflight_conversions,
+        target_latency_seconds=config.target_conversion_seconds
+    )
+    
+    # Create STL cache and trim it to size left over from previous runs
+    stl_cache = StlCache(
+        cache_dir=config.cache_dir,
+        max_bytes=config.cache_max_bytes
+    )
+    await to_thread.run_sync(stl_cache.evict)
+    
+    # Redis backs the per-client concurrency limiter; without it the limiter is a no-op
+    redis_client = aioredis.from_url(config.redis_url) if config.redis_url else None
+    if redis_client is None:
+        logger.warning("REDIS_URL not set - concurrent request limiting disabled")
+    
     # Store in app state
-    app.state.conversion_service = conversion_service
+    app.state.conversion_pool = conversion_pool
+    app.state.admission = admission
+    app.state.redis = redis_client
+    app.state.stl_cache = stl_cache
     app.state.file_validator = file_validator
     app.state.config = config
     
@@ -107,7 +221,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down CAD Engine...")
-    # Cleanup if needed
+    app.state.conversion_pool.shutdown(wait=True, cancel_futures=True)
+    if redis_client is not None:
+        await redis_client.aclose()
 
 # ============================================================================
 # FASTAPI APPLICATION
@@ -117,6 +233,7 @@ app = FastAPI(
     title="mithran CAD Engine",
     description="Professional STEP to STL conversion service with security and rate limiting",
     version="2.0.0",
+    default_response_class=ORJSONResponse,  # C serializer for all JSON responses
     lifespan=lifespan
 )
 
@@ -128,6 +245,27 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 # MIDDLEWARE
 # ============================================================================
 
+# Concurrent conversion limit per client, keyed by client IP. Only useful when
+# clients reach the engine directly: behind the backend every request shares
+# one IP, so deployments like docker-compose turn it off (0)
+# Middleware added later runs first: CORS, then the size check, then this limiter
+if config.max_concurrent_per_client > 0:
+    app.add_middleware(
+        ConcurrencyLimiter,
+        max_concurrent=config.max_concurrent_per_client,
+        ttl_seconds=config.concurrency_ttl_seconds
+    )
+
+# Oversized uploads are refused from Content-Length before any body is read
+# or a concurrency slot is taken
+app.add_middleware(
+    ContentLengthLimiter,
+    max_file_size_bytes=config.max_file_size_bytes
+)
+
+# RateLimit-* headers so clients can self-throttle (including on 429)
+app.add_middleware(RateLimitHeaders)
+
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
@@ -135,6 +273,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Original-Filename", "X-File-Size", "X-Mesh-Linear", "X-Mesh-Angular", "X-Mesh-LOD", "ETag",
+        "RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "Retry-After"
+    ],
     max_age=3600,  # Cache preflight requests for 1 hour
 )
 
@@ -142,17 +284,322 @@ app.add_middleware(
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def cleanup_files(*file_paths):
+async def cleanup_files(*file_paths):
     """
     Background task to cleanup temporary files after response is sent
+    
+    Unlinks run in a worker thread so disk I/O never blocks the event loop
     """
     for file_path in file_paths:
+        if not file_path:
+            continue
         try:
-            if file_path and os.path.exists(file_path):
-                os.unlink(file_path)
-                logger.info(f"Cleaned up temp file: {file_path}")
+            await to_thread.run_sync(os.unlink, file_path)
+            logger.info("Cleaned up temp file: %s", file_path)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logger.warning(f"Cleanup error for {file_path}: {str(e)}")
+            logger.warning("Cleanup error for %s: %s", file_path, e)
+
+
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """Write a buffer to a file descriptor, retrying on short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def hash_and_write(fd: int, data: bytes, hasher) -> None:
+    """Feed a chunk to the content hash and write it to a file descriptor"""
+    hasher.update(data)
+    write_all(fd, data)
+
+
+@dataclass
+class SavedUpload:
+    """Uploaded file stored in the temp directory"""
+    
+    path: str
+    size: int
+    digest: str  # BLAKE2b content hash, the basis of the STL cache key
+
+
+async def save_upload(file: UploadFile, file_validator: FileValidator) -> SavedUpload:
+    """
+    Validate an uploaded file and stream it to a new temp file in fixed-size chunks
+    
+    The whole file check (extension, size, magic number) runs once on the
+    first chunk while it is still in memory, before any temp file exists; the
+    size limit is then enforced as further bytes arrive, so the upload is
+    never held in memory as a whole or read back from disk. File creation,
+    hashing and writes run in a worker thread to keep the event loop free.
+    Where supported the file starts as an unnamed O_TMPFILE inode, so an
+    upload rejected midway leaves nothing to unlink.
+    
+    Args:
+        file: Uploaded file
+        file_validator: Validator for content and size checks
+        
+    Returns:
+        Saved upload with its temp path, size and content hash
+        
+    Raises:
+        FileValidationError: If extension, content or size validation fails
+            (the temp file is removed before raising)
+    """
+    first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    file_ext, total_size = file_validator.validate_file(first_chunk, len(first_chunk), file.filename)
+    
+    fd, temp_path = await to_thread.run_sync(create_temp_file, config.temp_dir, file_ext)
+    hasher = hashlib.blake2b(digest_size=16)
+    
+    try:
+        await to_thread.run_sync(hash_and_write, fd, first_chunk, hasher)
+        
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total_size += len(chunk)
+            file_validator.validate_size(total_size)
+            await to_thread.run_sync(hash_and_write, fd, chunk, hasher)
+        
+        # Unnamed O_TMPFILE uploads only get a directory entry once they pass validation
+        if temp_path is None:
+            temp_path = await to_thread.run_sync(name_temp_file, fd, config.temp_dir, file_ext)
+    except Exception:
+        await cleanup_files(temp_path)
+        raise
+    finally:
+        os.close(fd)
+    
+    return SavedUpload(path=temp_path, size=total_size, digest=hasher.hexdigest())
+
+
+async def run_conversion(
+    app: FastAPI,
+    admission: AdmissionController,
+    stl_cache: StlCache,
+    cache_key: str,
+    step_path: str,
+    stl_path: str
+) -> ConversionResult:
+    """
+    Produce the STL for an upload, from cache or by converting in the process pool
+    
+    A cache hit hard links the stored STL to stl_path and skips OCCT entirely;
+    a fresh conversion waits for admission, then its result is added to the cache.
+    The conversion pool is looked up only once admitted, so a pool replaced
+    after a crash while this request waited is never used.
+    
+    Args:
+        app: FastAPI application holding the conversion pool in app.state
+        admission: Adaptive limit on in-flight conversions
+        stl_cache: Converted STL cache
+        cache_key: Content hash of the STEP upload and the mesh settings
+        step_path: Input STEP file
+        stl_path: Output STL file
+        
+    Returns:
+        Conversion result with the STL path, its stat and the mesh settings used
+        
+    Raises:
+        ConversionError: If the conversion fails or its worker crashes
+    """
+    cached_stat = await to_thread.run_sync(stl_cache.link_into, cache_key, stl_path)
+    if cached_stat is not None:
+        logger.info("STL cache hit: %s", cache_key)
+        
+        # Mesh settings travel in the STL header; fall back to configured values
+        mesh_settings = await to_thread.run_sync(read_mesh_header, stl_path)
+        linear_deflection, angular_deflection = mesh_settings or (
+            config.linear_deflection, config.angular_deflection
+        )
+        return ConversionResult(
+            stl_path=stl_path,
+            stl_stat=cached_stat,
+            linear_deflection=linear_deflection,
+            angular_deflection=angular_deflection
+        )
+    
+    async with admission.admit():
+        conversion_pool: ProcessPoolExecutor = app.state.conversion_pool
+        try:
+            future = conversion_pool.submit(convert_in_worker, step_path, stl_path)
+        except BrokenProcessPool:
+            # Broken by another request's crash before it was replaced; this
+            # file never ran, so retry on a fresh pool
+            replace_conversion_pool(app, conversion_pool)
+            conversion_pool = app.state.conversion_pool
+            future = conversion_pool.submit(convert_in_worker, step_path, stl_path)
+        
+        try:
+            result = await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # The worker died mid-conversion; fail this upload, not the service
+            replace_conversion_pool(app, conversion_pool)
+            raise ConversionError("converter crashed while processing the file")
+    
+    await to_thread.run_sync(stl_cache.store, cache_key, result.stl_path)
+    return result
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag
+    
+    "*" is not treated as a match, since it would match every upload. Note that
+    answering a matching tag with 304 on POST deliberately departs from
+    RFC 9110 (which prescribes 412): the STL is a pure function of the upload,
+    so the client's cached copy is the response it asked for.
+    
+    Args:
+        if_none_match: Header value (a list of entity tags), if sent
+        etag: Quoted entity tag of the response
+        
+    Returns:
+        True if the client already holds this representation
+    """
+    if not if_none_match:
+        return False
+    
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.removeprefix("W/") == etag:
+            return True
+    
+    return False
+
+
+@dataclass
+class ConvertedUpload:
+    """Temp files produced for one conversion request"""
+    
+    step_path: Optional[str]
+    result: Optional[ConversionResult]  # None when the client's copy is current
+    etag: str
+    
+    def cache_headers(self) -> Dict[str, str]:
+        """HTTP caching headers for the STL representation"""
+        return {"ETag": self.etag, "Cache-Control": STL_CACHE_CONTROL}
+
+
+async def convert_upload(request: Request, file: UploadFile) -> ConvertedUpload:
+    """
+    Validate, store and convert an uploaded STEP file
+    
+    Shared pipeline for the conversion endpoints. If the request's
+    If-None-Match already names the upload's ETag, the upload is discarded
+    without converting. On failure all temp files are removed before raising;
+    on success the caller owns them.
+    
+    Args:
+        request: FastAPI request (for app state)
+        file: Uploaded STEP/IGES file
+        
+    Returns:
+        Converted upload with its STEP and STL temp paths and ETag
+        
+    Raises:
+        HTTPException: 400/413 on validation errors, 422 on conversion
+            errors (including a crashed worker), 500 on unexpected errors
+    """
+    admission: AdmissionController = request.app.state.admission
+    stl_cache: StlCache = request.app.state.stl_cache
+    file_validator: FileValidator = request.app.state.file_validator
+    
+    step_path = None
+    stl_path = None
+    
+    try:
+        # Validate file while streaming it to a temp location (extension, magic number, size)
+        try:
+            upload = await save_upload(file, file_validator)
+            step_path = upload.path
+            logger.info("File validated: %s (%s bytes)", file.filename, upload.size)
+        except FileSizeExceededError as e:
+            logger.warning("File validation failed: %s", e)
+            raise HTTPException(status_code=413, detail=str(e))
+        except FileValidationError as e:
+            logger.warning("File validation failed: %s", e)
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # Skip conversion if the client already has this STL
+        cache_key = f"{upload.digest}-{MESH_SETTINGS_TAG}"
+        etag = f'"{cache_key}"'
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            logger.info("Not modified: %s", file.filename)
+            await cleanup_files(step_path)
+            return ConvertedUpload(step_path=None, result=None, etag=etag)
+        
+        # Create output STL path
+        stl_path = str(Path(step_path).with_suffix('.stl'))
+        
+        # Convert STEP to STL
+        try:
+            result = await run_conversion(
+                request.app, admission, stl_cache, cache_key, step_path, stl_path
+            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Conversion successful: %s → STL", file.filename,
+                    extra={
+                        "upload_name": file.filename,
+                        "upload_bytes": upload.size,
+                        "stl_bytes": result.stl_stat.st_size,
+                        "linear_deflection": result.linear_deflection,
+                        "angular_deflection": result.angular_deflection
+                    }
+                )
+        except ConversionError as e:
+            logger.error("Conversion failed: %s", e)
+            raise HTTPException(
+                status_code=422,
+                detail=f"Conversion failed: {str(e)}"
+            )
+        
+        return ConvertedUpload(step_path=step_path, result=result, etag=etag)
+    
+    except HTTPException:
+        await cleanup_files(step_path, stl_path)
+        raise
+    except Exception as e:
+        # Cleanup on unexpected error
+        await cleanup_files(step_path, stl_path)
+        logger.error("Unexpected error: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error during conversion"
+        )
+
+
+# Raw bytes per base64 chunk; a multiple of 3 so encoded chunks concatenate without padding
+BASE64_CHUNK_SIZE = 57 * 1024
+
+
+def stream_base64_json(stl_path: str, metadata: Dict) -> Iterator[bytes]:
+    """
+    Stream a JSON object with the STL file embedded as base64
+    
+    The file is encoded chunk by chunk, so neither the raw STL nor its
+    base64 form is ever held in memory as a whole
+    
+    Args:
+        stl_path: Path to STL file
+        metadata: Non-empty JSON-serializable fields sent before the payload
+        
+    Yields:
+        Encoded JSON fragments
+    """
+    yield orjson.dumps(metadata)[:-1] + b',"stl_base64":"'
+    
+    with open(stl_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(BASE64_CHUNK_SIZE), b''):
+            # pybase64 1.3 re-exports b64encode without __all__, which pyright flags as private
+            yield pybase64.b64encode(chunk)  # pyright: ignore[reportPrivateImportUsage]
+    
+    yield b'"}'
 
 # ============================================================================
 # HEALTH & STATUS ENDPOINTS
@@ -171,20 +618,25 @@ async def root() -> Dict:
 
 
 @app.get("/health")
-async def health() -> Dict:
+async def health(request: Request) -> Dict:
     """Detailed health check endpoint"""
+    admission: AdmissionController = request.app.state.admission
+    
     return {
         "status": "healthy",
         "opencascade": "pythonocc-core 7.7.2",
         "capabilities": ["STEP", "IGES", "STL"],
         "limits": {
             "max_file_size_mb": config.max_file_size_bytes / (1024 * 1024),
-            "rate_limit_per_minute": config.rate_limit_per_minute
+            "rate_limit_per_minute": config.rate_limit_per_minute,
+            "max_concurrent_per_client": config.max_concurrent_per_client
         },
         "conversion_settings": {
             "linear_deflection": config.linear_deflection,
-            "angular_deflection": config.angular_deflection
-        }
+            "angular_deflection": config.angular_deflection,
+            "linear_relative_deflection": config.linear_relative_deflection
+        },
+        "admission": admission.stats()
     }
 
 # ============================================================================
@@ -192,12 +644,12 @@ async def health() -> Dict:
 # ============================================================================
 
 @app.post("/convert/step-to-stl")
-@limiter.limit(f"{config.rate_limit_per_minute}/minute")
+@limiter.limit(CONVERSION_RATE_LIMIT)
 async def convert_step_to_stl(
     request: Request,
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...)
-) -> FileResponse:
+) -> Response:
     """
     Convert STEP file to STL with security validation
     
@@ -207,165 +659,103 @@ async def convert_step_to_stl(
     - Rate limiting
     - Automatic cleanup
     
+    Conversion metadata is returned in X-* response headers alongside the
+    binary STL, so no encoding pass is needed on either side. Responses
+    carry an ETag; resending it in If-None-Match with the same file yields
+    304 Not Modified without a conversion.
+    
     Args:
         request: FastAPI request (for rate limiting)
         background_tasks: Background task manager
         file: Uploaded STEP/IGES file
         
     Returns:
-        STL file (binary format)
+        STL file (binary format), or an empty 304 response
         
     Raises:
         HTTPException: On validation or conversion errors
     """
-    conversion_service: ConversionService = request.app.state.conversion_service
-    file_validator: FileValidator = request.app.state.file_validator
+    logger.info("Received conversion request: %s from %s", file.filename, client_ip(request))
     
-    logger.info(f"Received conversion request: {file.filename} from {get_remote_address(request)}")
+    converted = await convert_upload(request, file)
+    result = converted.result
+    if result is None:
+        return Response(status_code=304, headers=converted.cache_headers())
     
-    step_path = None
-    stl_path = None
+    # Schedule cleanup after response is sent
+    background_tasks.add_task(cleanup_files, converted.step_path, result.stl_path)
     
-    try:
-        # Create temporary file for uploaded content
-        file_ext = Path(file.filename).suffix.lower()
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext, dir=config.temp_dir) as temp_step:
-            step_path = temp_step.name
-            
-            # Write uploaded file to temp location
-            content = await file.read()
-            temp_step.write(content)
-            temp_step.flush()
-        
-        # Validate file (size, extension, magic number)
-        try:
-            validated_ext, file_size = file_validator.validate_file(step_path, file.filename)
-            logger.info(f"File validated: {file.filename} ({file_size} bytes)")
-        except FileValidationError as e:
-            cleanup_files(step_path)
-            logger.warning(f"File validation failed: {str(e)}")
-            raise HTTPException(status_code=400, detail=str(e))
-        
-        # Create output STL path
-        stl_path = str(Path(step_path).with_suffix('.stl'))
-        
-        # Convert STEP to STL
-        try:
-            output_path = conversion_service.convert(step_path, stl_path)
-            logger.info(f"Conversion successful: {file.filename} → STL")
-        except ConversionError as e:
-            cleanup_files(step_path, stl_path)
-            logger.error(f"Conversion failed: {str(e)}")
-            raise HTTPException(
-                status_code=422,
-                detail=f"Conversion failed: {str(e)}"
-            )
-        
-        # Schedule cleanup after response is sent
-        background_tasks.add_task(cleanup_files, step_path, stl_path)
-        
-        # Return STL file
-        return FileResponse(
-            output_path,
-            media_type="application/octet-stream",
-            filename=Path(file.filename).stem + ".stl",
-            headers={
-                "X-Original-Filename": file.filename,
-                "X-Conversion-Engine": "OpenCascade",
-                "X-File-Size": str(os.path.getsize(output_path)),
-                "X-Mesh-Quality": f"linear={config.linear_deflection},angular={config.angular_deflection}"
-            }
-        )
-    
-    except HTTPException:
-        raise
-    except Exception as e:
-        # Cleanup on unexpected error
-        cleanup_files(step_path, stl_path)
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail="Internal server error during conversion"
-        )
+    # Return STL file (stat_result spares FileResponse its own stat call)
+    return FileResponse(
+        result.stl_path,
+        stat_result=result.stl_stat,
+        media_type="application/octet-stream",
+        filename=Path(file.filename).stem + ".stl",
+        headers={
+            "X-Original-Filename": file.filename,
+            "X-Conversion-Engine": "OpenCascade",
+            "X-File-Size": str(result.stl_stat.st_size),
+            "X-Mesh-Quality": f"linear={result.linear_deflection},angular={result.angular_deflection}",
+            "X-Mesh-Linear": str(result.linear_deflection),
+            "X-Mesh-Angular": str(result.angular_deflection),
+            "X-Mesh-LOD": f"{result.linear_deflection / config.linear_deflection:.3g}",
+            **converted.cache_headers()
+        }
+    )
 
 
 @app.post("/convert/step-to-stl-base64")
-@limiter.limit(f"{config.rate_limit_per_minute}/minute")
+@limiter.limit(CONVERSION_RATE_LIMIT)
 async def convert_step_to_stl_base64(
     request: Request,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...)
-) -> Dict:
+) -> Response:
     """
-    Convert STEP file to STL and return as base64
+    Convert STEP file to STL and return as base64 (legacy)
     
-    Useful for direct embedding in responses or APIs
+    Kept for callers that need a single JSON document; base64 adds a third
+    to the payload, so new clients should use /convert/step-to-stl and read
+    the metadata from its response headers.
     
     Args:
         request: FastAPI request (for rate limiting)
+        background_tasks: Background task manager
         file: Uploaded STEP/IGES file
         
     Returns:
-        JSON with base64-encoded STL data
+        Streamed JSON with base64-encoded STL data, or an empty 304 response
         
     Raises:
         HTTPException: On validation or conversion errors
     """
-    import base64
-    
-    conversion_service: ConversionService = request.app.state.conversion_service
-    file_validator: FileValidator = request.app.state.file_validator
+    logger.info("Received base64 conversion request: %s", file.filename)
     
-    logger.info(f"Received base64 conversion request: {file.filename}")
+    converted = await convert_upload(request, file)
+    result = converted.result
+    if result is None:
+        return Response(status_code=304, headers=converted.cache_headers())
     
-    step_path = None
-    stl_path = None
-    
-    try:
-        # Create temporary file
-        file_ext = Path(file.filename).suffix.lower()
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext, dir=config.temp_dir) as temp_step:
-            step_path = temp_step.name
-            content = await file.read()
-            temp_step.write(content)
-            temp_step.flush()
-        
-        # Validate file
-        try:
-            validated_ext, file_size = file_validator.validate_file(step_path, file.filename)
-        except FileValidationError as e:
-            cleanup_files(step_path)
-            raise HTTPException(status_code=400, detail=str(e))
-        
-        stl_path = str(Path(step_path).with_suffix('.stl'))
-        
-        # Convert
-        try:
-            output_path = conversion_service.convert(step_path, stl_path)
-        except ConversionError as e:
-            cleanup_files(step_path, stl_path)
-            raise HTTPException(status_code=422, detail=f"Conversion failed: {str(e)}")
-        
-        # Read STL and encode to base64
-        with open(output_path, 'rb') as f:
-            stl_data = f.read()
-        
-        stl_base64 = base64.b64encode(stl_data).decode('utf-8')
-        
-        return {
-            "success": True,
-            "original_filename": file.filename,
-            "stl_filename": Path(file.filename).stem + ".stl",
-            "stl_size": len(stl_data),
-            "stl_base64": stl_base64,
-            "mesh_quality": {
-                "linear_deflection": config.linear_deflection,
-                "angular_deflection": config.angular_deflection
-            }
+    metadata = {
+        "success": True,
+        "original_filename": file.filename,
+        "stl_filename": Path(file.filename).stem + ".stl",
+        "stl_size": result.stl_stat.st_size,
+        "mesh_quality": {
+            "linear_deflection": result.linear_deflection,
+            "angular_deflection": result.angular_deflection
         }
+    }
     
-    finally:
-        # Always cleanup
-        cleanup_files(step_path, stl_path)
+    # Schedule cleanup after the stream has been sent
+    background_tasks.add_task(cleanup_files, converted.step_path, result.stl_path)
+    
+    # Encode STL to base64 while streaming
+    return StreamingResponse(
+        stream_base64_json(result.stl_path, metadata),
+        media_type="application/json",
+        headers=converted.cache_headers()
+    )
 
 
 # ============================================================================
@@ -375,8 +765,8 @@ async def convert_step_to_stl_base64(
 @app.exception_handler(CADEngineException)
 async def cad_engine_exception_handler(request: Request, exc: CADEngineException):
     """Handle CAD engine specific exceptions"""
-    logger.error(f"CAD Engine error: {str(exc)}")
-    return JSONResponse(
+    logger.error("CAD Engine error: %s", exc)
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": "CAD Engine Error",
@@ -390,13 +780,20 @@ async def cad_engine_exception_handler(request: Request, exc: CADEngineException
 # ============================================================================
 
 if __name__ == "__main__":
-    logger.info(f"Starting CAD Engine on {config.host}:{config.port}")
+    logger.info("Starting CAD Engine on %s:%s", config.host, config.port)
     
+    # uvloop + httptools replace the pure-Python event loop and HTTP parser.
+    # Each worker process runs its own lifespan (conversion pool, cache, admission).
     uvicorn.run(
         "main:app",
         host=config.host,
         port=config.port,
-        reload=(config.environment == "production"),
+        workers=config.workers,
+        loop="uvloop",
+        http="httptools",
         log_level=config.log_level.lower(),
-        access_log=True
+        access_log=not config.is_production(),
+        # With JSON logs, uvicorn's loggers keep no handlers of their own and
+        # propagate to the root JsonFormatter handler configured on import
+        log_config=None if config.log_format == "json" else LOGGING_CONFIG
     )
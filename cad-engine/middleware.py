@@ -0,0 +1,255 @@
+"""
+ASGI middleware for request admission
+
+Rejects oversized uploads up front, bounds how many heavy conversion
+requests a single client can have in flight and advertises rate limit state
+"""
+
+import time
+import uuid
+import logging
+
+from anyio import to_thread
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from limits.storage import MemoryStorage
+from starlette.datastructures import MutableHeaders
+from slowapi.util import get_remote_address
+
+
+logger = logging.getLogger(__name__)
+
+
+# Atomically drop expired entries, check the cap and register the request.
+# Scores are arrival timestamps, so entries left behind by a crashed worker
+# age out after the TTL instead of blocking the client forever.
+ACQUIRE_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - ttl)
+if redis.call('ZCARD', key) >= limit then
+    return 0
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('EXPIRE', key, ttl)
+return 1
+"""
+
+
+def client_ip(request: Request) -> str:
+    """
+    Client address used as the rate and concurrency limit key
+
+    Resolved once per request and cached on request.state, which is shared
+    by the middleware, the slowapi key function and the endpoints
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Client IP address
+    """
+    ip = getattr(request.state, "client_ip", None)
+    if ip is None:
+        ip = get_remote_address(request)
+        request.state.client_ip = ip
+    return ip
+
+
+# Allowance for multipart boundaries and part headers on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class ContentLengthLimiter:
+    """
+    Rejects requests whose declared Content-Length exceeds the upload limit
+
+    Runs before the multipart body is parsed, so oversized uploads are refused
+    without receiving or spooling them. Clients that understate Content-Length
+    are still caught by the size check while the upload is streamed to disk.
+    """
+
+    def __init__(self, app, max_file_size_bytes: int, path_prefix: str = "/convert"):
+        """
+        Initialize content length limiter
+
+        Args:
+            app: Wrapped ASGI application
+            max_file_size_bytes: Maximum allowed uploaded file size
+            path_prefix: Only requests under this path are checked
+        """
+        self.app = app
+        self.max_file_size_bytes = max_file_size_bytes
+        self.max_body_bytes = max_file_size_bytes + MULTIPART_OVERHEAD_BYTES
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+                break
+
+        if content_length is not None:
+            try:
+                body_size = int(content_length)
+            except ValueError:
+                response = ORJSONResponse(
+                    status_code=400,
+                    content={"error": "Bad Request", "detail": "Invalid Content-Length header"}
+                )
+                await response(scope, receive, send)
+                return
+
+            if body_size > self.max_body_bytes:
+                max_mb = self.max_file_size_bytes / (1024 * 1024)
+                response = ORJSONResponse(
+                    status_code=413,
+                    content={
+                        "error": "Payload Too Large",
+                        "detail": f"File too large. Maximum allowed size is {max_mb:.2f}MB"
+                    }
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+
+class ConcurrencyLimiter:
+    """
+    Per-client concurrent request limiter backed by a Redis sorted set
+
+    Unlike the per-minute rate limit, this caps simultaneous requests, so a
+    client cannot start a burst of long-running conversions at once.
+    Uses the Redis client stored in app.state.redis; when it is not
+    configured or unreachable, requests are let through.
+    """
+
+    def __init__(self, app, max_concurrent: int, ttl_seconds: int, path_prefix: str = "/convert"):
+        """
+        Initialize concurrency limiter
+
+        Args:
+            app: Wrapped ASGI application
+            max_concurrent: Maximum in-flight requests per client
+            ttl_seconds: Age after which an unreleased slot is discarded
+            path_prefix: Only requests under this path are limited
+        """
+        self.app = app
+        self.max_concurrent = max_concurrent
+        self.ttl_seconds = ttl_seconds
+        self.path_prefix = path_prefix
+        self._acquire_script = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        redis = getattr(scope["app"].state, "redis", None)
+        if redis is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = f"cad-engine:concurrency:{client_ip(Request(scope))}"
+        request_id = uuid.uuid4().hex
+
+        try:
+            if self._acquire_script is None:
+                self._acquire_script = redis.register_script(ACQUIRE_SCRIPT)
+            acquired = await self._acquire_script(
+                keys=[key],
+                args=[time.time(), self.ttl_seconds, self.max_concurrent, request_id]
+            )
+        except Exception as e:
+            logger.warning("Concurrency limiter unavailable, allowing request: %s", e)
+            await self.app(scope, receive, send)
+            return
+
+        if not acquired:
+            logger.warning("Concurrent request limit exceeded for %s", key)
+            response = ORJSONResponse(
+                status_code=429,
+                content={
+                    "error": "Too Many Requests",
+                    "detail": f"At most {self.max_concurrent} concurrent conversions per client"
+                }
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            try:
+                await redis.zrem(key, request_id)
+            except Exception as e:
+                logger.warning("Failed to release concurrency slot for %s: %s", key, e)
+
+
+class RateLimitHeaders:
+    """
+    Adds RateLimit-* headers (IETF RateLimit header fields draft) to rate limited responses
+
+    Reads the limit slowapi evaluated for the request from request.state and
+    reports it as RateLimit-Limit, RateLimit-Remaining and RateLimit-Reset
+    (seconds until the window resets), plus Retry-After on 429 responses, so
+    clients can back off instead of retrying into the limit.
+
+    Reading the window is a second storage round trip after slowapi's own
+    (synchronous) hit; with Redis storage it runs in a worker thread so it
+    does not block the event loop, in-process counters are read directly.
+    """
+
+    def __init__(self, app):
+        """
+        Initialize rate limit header middleware
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                view_rate_limit = scope.get("state", {}).get("view_rate_limit")
+                if view_rate_limit is not None:
+                    await self._add_headers(scope, message, view_rate_limit)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    async def _add_headers(self, scope, message, view_rate_limit) -> None:
+        limit_item, limit_args = view_rate_limit
+        try:
+            # slowapi switches to its in-memory fallback limiter while Redis is down
+            rate_limiter = scope["app"].state.limiter.limiter
+            if isinstance(rate_limiter.storage, MemoryStorage):
+                reset_at, remaining = rate_limiter.get_window_stats(limit_item, *limit_args)
+            else:
+                reset_at, remaining = await to_thread.run_sync(
+                    rate_limiter.get_window_stats, limit_item, *limit_args
+                )
+        except Exception as e:
+            logger.warning("Could not read rate limit window: %s", e)
+            return
+
+        reset_in = str(max(0, int(reset_at - time.time())))
+        headers = MutableHeaders(scope=message)
+        headers["RateLimit-Limit"] = str(limit_item.amount)
+        headers["RateLimit-Remaining"] = str(max(0, remaining))
+        headers["RateLimit-Reset"] = reset_in
+        if message["status"] == 429:
+            headers["Retry-After"] = reset_in
@@ -6,14 +6,19 @@ Refactored with SOLID principles and dependency injection
 
 import os
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Tuple
 from pathlib import Path
 
-from OCC.Core.STEPControl import STEPControl_Reader
+from OCC.Core.STEPControl import STEPControl_Reader, STEPControl_Controller
+from OCC.Core.Interface import Interface_Static
 from OCC.Core.IFSelect import IFSelect_RetDone
 from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.BRepBndLib import brepbndlib
 from OCC.Core.StlAPI import StlAPI_Writer
 from OCC.Core.TopoDS import TopoDS_Shape
+from OCC.Core.OSD import OSD_ThreadPool
 
 from exceptions import StepReadError, MeshingError, StlWriteError, ConversionError
 
@@ -21,13 +26,90 @@ from exceptions import StepReadError, MeshingError, StlWriteError, ConversionErr
 logger = logging.getLogger(__name__)
 
 
+# Binary STL files start with a free-form 80-byte header; ours records the mesh settings
+STL_HEADER_SIZE = 80
+MESH_HEADER_PREFIX = "mithran mesh"
+
+
+def format_mesh_header(linear_deflection: float, angular_deflection: float) -> bytes:
+    """
+    Build a binary STL header recording the mesh settings
+    
+    Args:
+        linear_deflection: Linear deflection used for meshing
+        angular_deflection: Angular deflection used for meshing
+        
+    Returns:
+        80-byte STL header
+    """
+    text = f"{MESH_HEADER_PREFIX} linear={linear_deflection:.6g} angular={angular_deflection:.6g}"
+    return text.encode("ascii").ljust(STL_HEADER_SIZE)
+
+
+def read_mesh_header(stl_file_path: str) -> Optional[Tuple[float, float]]:
+    """
+    Read the mesh settings recorded in a binary STL header
+    
+    Args:
+        stl_file_path: Path to STL file
+        
+    Returns:
+        Tuple of (linear deflection, angular deflection), or None if the
+        header was not written by this service
+    """
+    try:
+        with open(stl_file_path, 'rb') as f:
+            text = f.read(STL_HEADER_SIZE).decode("ascii").strip()
+        
+        if not text.startswith(MESH_HEADER_PREFIX):
+            return None
+        
+        fields = dict(field.split("=", 1) for field in text[len(MESH_HEADER_PREFIX):].split())
+        return float(fields["linear"]), float(fields["angular"])
+    except (OSError, UnicodeDecodeError, ValueError, KeyError):
+        return None
+
+
+@dataclass
+class ConversionResult:
+    """Output of one STEP to STL conversion"""
+    
+    stl_path: str
+    stl_stat: os.stat_result
+    linear_deflection: float  # Effective value after level-of-detail scaling
+    angular_deflection: float
+
+
 class StepReader:
     """
     Reads STEP files and converts to TopoDS_Shape
     
     Single Responsibility: Only handles STEP file reading
+    
+    A fresh STEPControl_Reader is created per file so no transfer state
+    carries over between requests; process-wide STEP setup lives in warm_up.
     """
     
+    def __init__(self, length_unit: str = "MM"):
+        """
+        Initialize STEP reader
+        
+        Args:
+            length_unit: Length unit shapes are converted to on transfer
+        """
+        self.length_unit = length_unit
+    
+    def warm_up(self) -> None:
+        """
+        Perform one-time STEP setup for the current process
+        
+        Loads the STEP schema and sets the transfer unit up front, so the
+        first file read in a process is not slower than the rest
+        """
+        STEPControl_Controller.Init()
+        Interface_Static.SetCVal("xstep.cascade.unit", self.length_unit)
+        logger.info("StepReader warmed up (unit: %s)", self.length_unit)
+    
     def read(self, step_file_path: str) -> TopoDS_Shape:
         """
         Read STEP file and return shape
@@ -42,21 +124,22 @@ class StepReader:
             StepReadError: If reading fails
         """
         try:
-            logger.info(f"Reading STEP file: {step_file_path}")
+            logger.info("Reading STEP file: %s", step_file_path)
             
             # Verify file exists
-            if not os.path.exists(step_file_path):
+            try:
+                file_size = os.stat(step_file_path).st_size
+            except FileNotFoundError:
                 raise StepReadError(f"STEP file does not exist: {step_file_path}")
             
-            file_size = os.path.getsize(step_file_path)
-            logger.info(f"STEP file size: {file_size} bytes")
+            logger.info("STEP file size: %s bytes", file_size)
             
             # Create STEP reader
             reader = STEPControl_Reader()
             
             # Read file
             status = reader.ReadFile(step_file_path)
-            logger.info(f"STEP read status: {status}")
+            logger.info("STEP read status: %s", status)
             
             if status != IFSelect_RetDone:
                 raise StepReadError(f"Failed to read STEP file, status code: {status}")
@@ -64,7 +147,7 @@ class StepReader:
             # Transfer roots to document
             logger.info("Transferring roots...")
             nb_roots = reader.TransferRoots()
-            logger.info(f"Transferred {nb_roots} roots")
+            logger.info("Transferred %s roots", nb_roots)
             
             # Get shape
             shape = reader.OneShape()
@@ -72,13 +155,13 @@ class StepReader:
             if shape.IsNull():
                 raise StepReadError("STEP file contains no valid shapes")
             
-            logger.info(f"Successfully read STEP file - Shape type: {shape.ShapeType()}")
+            logger.info("Successfully read STEP file - Shape type: %s", shape.ShapeType())
             return shape
         
         except StepReadError:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error reading STEP file: {str(e)}", exc_info=True)
+            logger.error("Unexpected error reading STEP file: %s", e, exc_info=True)
             raise StepReadError(f"Error reading STEP file: {str(e)}")
 
 
@@ -89,27 +172,70 @@ class ShapeMesher:
     Single Responsibility: Only handles meshing operations
     """
     
-    def __init__(self, linear_deflection: float, angular_deflection: float):
+    def __init__(
+        self,
+        linear_deflection: float,
+        angular_deflection: float,
+        parallel: bool = True,
+        linear_relative: float = 0.0
+    ):
         """
         Initialize mesher with quality settings
         
         Args:
             linear_deflection: Mesh linear deflection (smaller = higher quality)
             angular_deflection: Mesh angular deflection in radians
+            parallel: Mesh faces on OCCT worker threads
+            linear_relative: Minimum linear deflection as a fraction of the
+                bounding box diagonal (0 disables level-of-detail scaling)
         """
         self.linear_deflection = linear_deflection
         self.angular_deflection = angular_deflection
+        self.parallel = parallel
+        self.linear_relative = linear_relative
         logger.info(
-            f"ShapeMesher initialized (linear: {linear_deflection}, "
-            f"angular: {angular_deflection})"
+            "ShapeMesher initialized (linear: %s, angular: %s, parallel: %s, linear relative: %s)",
+            linear_deflection, angular_deflection, parallel, linear_relative
         )
     
-    def mesh(self, shape: TopoDS_Shape) -> TopoDS_Shape:
+    def linear_deflection_for(self, shape: TopoDS_Shape) -> float:
+        """
+        Linear deflection for a shape, coarsened for large models
+        
+        Poor man's level of detail: the deflection grows with the bounding box
+        diagonal, so large assemblies do not produce excessive triangle counts.
+        
+        Args:
+            shape: TopoDS_Shape to be meshed
+            
+        Returns:
+            Linear deflection, never finer than the configured value
+        """
+        if self.linear_relative <= 0:
+            return self.linear_deflection
+        
+        bbox = Bnd_Box()
+        brepbndlib.Add(shape, bbox)
+        if bbox.IsVoid():
+            return self.linear_deflection
+        
+        # Rounded to what the STL header records, so cached results report the same value
+        diagonal = bbox.SquareExtent() ** 0.5
+        return float(f"{max(self.linear_deflection, diagonal * self.linear_relative):.6g}")
+    
+    def mesh(
+        self,
+        shape: TopoDS_Shape,
+        linear_deflection: Optional[float] = None,
+        angular_deflection: Optional[float] = None
+    ) -> TopoDS_Shape:
         """
         Create triangular mesh from B-Rep shape
         
         Args:
             shape: TopoDS_Shape to mesh
+            linear_deflection: Override for the configured linear deflection
+            angular_deflection: Override for the configured angular deflection
             
         Returns:
             Meshed TopoDS_Shape
@@ -118,15 +244,20 @@ class ShapeMesher:
             MeshingError: If meshing fails
         """
         try:
-            logger.info("Meshing shape...")
+            if linear_deflection is None:
+                linear_deflection = self.linear_deflection
+            if angular_deflection is None:
+                angular_deflection = self.angular_deflection
+            
+            logger.info("Meshing shape (linear: %s, angular: %s)...", linear_deflection, angular_deflection)
             
             # Create incremental mesh
             mesh = BRepMesh_IncrementalMesh(
                 shape,
-                self.linear_deflection,
+                linear_deflection,
                 False,  # Not relative
-                self.angular_deflection,
-                True    # In parallel
+                angular_deflection,
+                self.parallel
             )
             
             mesh.Perform()
@@ -140,7 +271,7 @@ class ShapeMesher:
         except MeshingError:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during meshing: {str(e)}", exc_info=True)
+            logger.error("Unexpected error during meshing: %s", e, exc_info=True)
             raise MeshingError(f"Error meshing shape: {str(e)}")
 
 
@@ -159,24 +290,30 @@ class StlWriter:
             ascii_mode: If True, write ASCII STL; if False, write binary STL
         """
         self.ascii_mode = ascii_mode
-        logger.info(f"StlWriter initialized (ASCII mode: {ascii_mode})")
+        logger.info("StlWriter initialized (ASCII mode: %s)", ascii_mode)
     
-    def write(self, shape: TopoDS_Shape, stl_file_path: str) -> str:
+    def write(
+        self,
+        shape: TopoDS_Shape,
+        stl_file_path: str,
+        header: Optional[bytes] = None
+    ) -> Tuple[str, os.stat_result]:
         """
         Write shape to STL file
         
         Args:
             shape: TopoDS_Shape to export
             stl_file_path: Output STL file path
+            header: 80-byte header to stamp into a binary STL
             
         Returns:
-            Path to written STL file
+            Tuple of (path to written STL file, its stat result)
             
         Raises:
             StlWriteError: If writing fails
         """
         try:
-            logger.info(f"Writing STL file: {stl_file_path}")
+            logger.info("Writing STL file: %s", stl_file_path)
             
             # Create STL writer
             stl_writer = StlAPI_Writer()
@@ -185,19 +322,29 @@ class StlWriter:
             # Write to file
             stl_writer.Write(shape, stl_file_path)
             
-            # Verify file was created
-            if not os.path.exists(stl_file_path):
+            # Verify file was created, replacing the writer's header in place first.
+            # Triangles are packed by OCCT in C++; Python only touches these 80 bytes,
+            # with one pwrite and an fstat on the same descriptor
+            stamp = None if header is None or self.ascii_mode else header[:STL_HEADER_SIZE]
+            try:
+                fd = os.open(stl_file_path, os.O_RDONLY if stamp is None else os.O_RDWR)
+            except FileNotFoundError:
                 raise StlWriteError("STL file was not created")
+            try:
+                if stamp is not None:
+                    os.pwrite(fd, stamp.ljust(STL_HEADER_SIZE), 0)
+                stl_stat = os.fstat(fd)
+            finally:
+                os.close(fd)
             
-            file_size = os.path.getsize(stl_file_path)
-            logger.info(f"STL file written successfully ({file_size} bytes)")
+            logger.info("STL file written successfully (%s bytes)", stl_stat.st_size)
             
-            return stl_file_path
+            return stl_file_path, stl_stat
         
         except StlWriteError:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error writing STL file: {str(e)}", exc_info=True)
+            logger.error("Unexpected error writing STL file: %s", e, exc_info=True)
             raise StlWriteError(f"Error writing STL file: {str(e)}")
 
 
@@ -227,7 +374,11 @@ class ConversionService:
         self.stl_writer = stl_writer
         logger.info("ConversionService initialized")
     
-    def convert(self, step_file_path: str, stl_file_path: str) -> str:
+    def warm_up(self) -> None:
+        """Perform one-time setup so the first conversion is not slower than the rest"""
+        self.step_reader.warm_up()
+    
+    def convert(self, step_file_path: str, stl_file_path: str) -> ConversionResult:
         """
         Complete conversion pipeline: STEP → STL
         
@@ -236,29 +387,136 @@ class ConversionService:
             stl_file_path: Output STL file
             
         Returns:
-            Path to output STL file
+            Conversion result with the STL path, its stat and the mesh settings used
             
         Raises:
             ConversionError: If any step in the pipeline fails
         """
-        logger.info(f"Starting conversion: {step_file_path} → {stl_file_path}")
+        logger.info("Starting conversion: %s → %s", step_file_path, stl_file_path)
         
         try:
             # Step 1: Read STEP file
             shape = self.step_reader.read(step_file_path)
             
-            # Step 2: Mesh the shape
-            meshed_shape = self.shape_mesher.mesh(shape)
+            # Step 2: Mesh the shape (deflection scaled to model size)
+            linear_deflection = self.shape_mesher.linear_deflection_for(shape)
+            angular_deflection = self.shape_mesher.angular_deflection
+            meshed_shape = self.shape_mesher.mesh(shape, linear_deflection, angular_deflection)
             
             # Step 3: Write STL file
-            output_path = self.stl_writer.write(meshed_shape, stl_file_path)
+            output_path, stl_stat = self.stl_writer.write(
+                meshed_shape,
+                stl_file_path,
+                header=format_mesh_header(linear_deflection, angular_deflection)
+            )
             
             logger.info("Conversion completed successfully")
-            return output_path
+            return ConversionResult(
+                stl_path=output_path,
+                stl_stat=stl_stat,
+                linear_deflection=linear_deflection,
+                angular_deflection=angular_deflection
+            )
         
         except (StepReadError, MeshingError, StlWriteError) as e:
-            logger.error(f"Conversion failed: {str(e)}")
+            logger.error("Conversion failed: %s", e)
             raise ConversionError(f"Conversion failed: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected conversion error: {str(e)}", exc_info=True)
+            logger.error("Unexpected conversion error: %s", e, exc_info=True)
             raise ConversionError(f"Unexpected error during conversion: {str(e)}")
+
+
+def build_conversion_service(
+    linear_deflection: float,
+    angular_deflection: float,
+    parallel: bool = True,
+    linear_relative: float = 0.0
+) -> ConversionService:
+    """
+    Build a conversion service with production settings
+    
+    Args:
+        linear_deflection: Mesh linear deflection
+        angular_deflection: Mesh angular deflection in radians
+        parallel: Mesh faces on OCCT worker threads
+        linear_relative: Linear deflection floor relative to model size
+        
+    Returns:
+        Configured ConversionService
+    """
+    return ConversionService(
+        step_reader=StepReader(),
+        shape_mesher=ShapeMesher(
+            linear_deflection=linear_deflection,
+            angular_deflection=angular_deflection,
+            parallel=parallel,
+            linear_relative=linear_relative
+        ),
+        stl_writer=StlWriter(ascii_mode=False)  # Binary STL for smaller files
+    )
+
+
+# ============================================================================
+# PROCESS POOL ENTRY POINTS
+# ============================================================================
+
+# Conversion service owned by the current pool worker process
+_worker_service: Optional[ConversionService] = None
+
+
+def init_worker(
+    linear_deflection: float,
+    angular_deflection: float,
+    linear_relative: float,
+    parallel: bool,
+    mesh_threads: int
+) -> None:
+    """
+    Process pool initializer - builds and warms up the conversion service once per worker
+    
+    Caps OCCT's thread pool at mesh_threads so parallel meshing in several
+    worker processes does not oversubscribe the CPUs.
+    
+    Args:
+        linear_deflection: Mesh linear deflection
+        angular_deflection: Mesh angular deflection in radians
+        linear_relative: Linear deflection floor relative to model size
+        parallel: Mesh faces on OCCT worker threads
+        mesh_threads: Meshing threads available to this worker
+    """
+    global _worker_service
+    
+    os.environ["OMP_NUM_THREADS"] = str(mesh_threads)
+    try:
+        # The default pool is sized on first use, so this must run before any meshing
+        OSD_ThreadPool.DefaultPool(mesh_threads)
+    except Exception as e:
+        logger.warning("Could not size OCCT thread pool: %s", e)
+    
+    _worker_service = build_conversion_service(
+        linear_deflection,
+        angular_deflection,
+        parallel=parallel and mesh_threads > 1,
+        linear_relative=linear_relative
+    )
+    _worker_service.warm_up()
+
+
+def convert_in_worker(step_file_path: str, stl_file_path: str) -> ConversionResult:
+    """
+    Run a conversion inside a pool worker process
+    
+    Args:
+        step_file_path: Input STEP file
+        stl_file_path: Output STL file
+        
+    Returns:
+        Conversion result with the STL path, its stat and the mesh settings used
+        
+    Raises:
+        ConversionError: If any step in the pipeline fails
+    """
+    if _worker_service is None:
+        raise ConversionError("Conversion worker was not initialized")
+    
+    return _worker_service.convert(step_file_path, stl_file_path)
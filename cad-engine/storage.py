@@ -0,0 +1,130 @@
+"""
+Temp file storage helpers
+
+Creates upload temp files as unnamed O_TMPFILE inodes where the platform
+supports it, so rejected uploads never create or remove a directory entry
+"""
+
+import os
+import uuid
+import logging
+import tempfile
+from typing import Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Cleared on the first failure, e.g. when the temp filesystem lacks O_TMPFILE support
+_o_tmpfile_available = hasattr(os, "O_TMPFILE")
+
+# Read size when copying an unnamed file whose inode cannot be linked
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def is_tmpfs(path: str) -> bool:
+    """
+    Check whether a directory is backed by tmpfs (Linux only)
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        True if the mount holding path is tmpfs
+    """
+    real_path = os.path.realpath(path)
+    best_mount = ""
+    best_type = ""
+
+    try:
+        with open("/proc/mounts") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point, fs_type = fields[1], fields[2]
+                is_parent = real_path == mount_point or real_path.startswith(mount_point.rstrip("/") + "/")
+                if is_parent and len(mount_point) >= len(best_mount):
+                    best_mount, best_type = mount_point, fs_type
+    except OSError:
+        return False
+
+    return best_type == "tmpfs"
+
+
+def create_temp_file(directory: str, suffix: str) -> Tuple[int, Optional[str]]:
+    """
+    Open a new writable temp file
+
+    Prefers an unnamed O_TMPFILE inode, which needs no unlink if discarded;
+    falls back to a named file from tempfile.mkstemp.
+
+    Args:
+        directory: Directory to create the file in
+        suffix: Suffix for a named file
+
+    Returns:
+        Tuple of (file descriptor, path or None for an unnamed file)
+    """
+    global _o_tmpfile_available
+
+    if _o_tmpfile_available:
+        try:
+            return os.open(directory, os.O_TMPFILE | os.O_RDWR, 0o600), None
+        except OSError as e:
+            _o_tmpfile_available = False
+            logger.info("O_TMPFILE unavailable in %s, using named temp files: %s", directory, e)
+
+    return tempfile.mkstemp(suffix, None, directory)
+
+
+def name_temp_file(fd: int, directory: str, suffix: str) -> str:
+    """
+    Link an unnamed O_TMPFILE inode into the directory
+
+    If the inode cannot be linked (e.g. /proc is not mounted), its contents
+    are copied to a named temp file instead and O_TMPFILE is not used again.
+
+    Args:
+        fd: File descriptor from create_temp_file
+        directory: Directory to link the file into
+        suffix: File name suffix
+
+    Returns:
+        Path of the linked file
+    """
+    global _o_tmpfile_available
+
+    name = f"tmp{uuid.uuid4().hex}{suffix}"
+
+    # Passing a directory fd makes os.link use linkat(AT_SYMLINK_FOLLOW), which
+    # resolves the /proc magic link to the inode; plain link() fails with EXDEV
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.link(f"/proc/self/fd/{fd}", name, dst_dir_fd=dir_fd, follow_symlinks=True)
+        return os.path.join(directory, name)
+    except OSError as e:
+        _o_tmpfile_available = False
+        logger.info("Cannot link O_TMPFILE inodes in %s, using named temp files: %s", directory, e)
+    finally:
+        os.close(dir_fd)
+
+    return _copy_to_named_file(fd, directory, suffix)
+
+
+def _copy_to_named_file(fd: int, directory: str, suffix: str) -> str:
+    """Copy an unnamed file's contents into a new file from tempfile.mkstemp"""
+    named_fd, path = tempfile.mkstemp(suffix, None, directory)
+    try:
+        offset = 0
+        while chunk := os.pread(fd, COPY_CHUNK_SIZE, offset):
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(named_fd, view):]
+            offset += len(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    finally:
+        os.close(named_fd)
+
+    return path
@@ -4,7 +4,6 @@ File validation utilities
 Provides security-focused file validation including magic number checking
 """
 
-import os
 from pathlib import Path
 from typing import Tuple
 
@@ -20,6 +19,9 @@ STEP_MAGIC_NUMBERS = [
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'.step', '.stp', '.iges', '.igs'}
 
+# Number of leading bytes inspected for a magic number
+MAGIC_HEADER_SIZE = 512
+
 
 class FileValidator:
     """Validates uploaded files for security and compatibility"""
@@ -33,18 +35,18 @@ class FileValidator:
         """
         self.max_file_size_bytes = max_file_size_bytes
     
-    def validate_file_size(self, file_path: str) -> None:
+    def validate_size(self, file_size: int) -> None:
         """
-        Validate file size
+        Validate a byte count against the size limit
+        
+        Usable while an upload is still streaming in
         
         Args:
-            file_path: Path to file
+            file_size: Number of bytes received so far
             
         Raises:
-            FileSizeExceededError: If file exceeds size limit
+            FileSizeExceededError: If size exceeds limit
         """
-        file_size = os.path.getsize(file_path)
-        
         if file_size > self.max_file_size_bytes:
             max_mb = self.max_file_size_bytes / (1024 * 1024)
             actual_mb = file_size / (1024 * 1024)
@@ -74,44 +76,43 @@ class FileValidator:
         
         return file_ext
     
-    def validate_magic_number(self, file_path: str) -> None:
+    def validate_header(self, header: bytes) -> None:
         """
-        Validate file content using magic number (file signature)
+        Validate leading file bytes against STEP magic numbers
         
-        This prevents users from uploading malicious files with renamed extensions
+        Accepts the first chunk of an upload directly, so the content check
+        does not need to re-open the file on disk
         
         Args:
-            file_path: Path to file
+            header: Leading bytes of the file (only the first 512 are inspected)
             
         Raises:
             InvalidFileTypeError: If file signature doesn't match STEP format
         """
-        try:
-            # Read first 512 bytes for magic number check
-            with open(file_path, 'rb') as f:
-                header = f.read(512)
-            
-            # Check for STEP magic numbers
-            is_valid = any(
-                magic_num in header 
-                for magic_num in STEP_MAGIC_NUMBERS
-            )
-            
-            if not is_valid:
-                raise InvalidFileTypeError(
-                    "File content does not match STEP format. "
-                    "Please upload a valid STEP/IGES file."
-                )
+        header = header[:MAGIC_HEADER_SIZE]
+        
+        # Check for STEP magic numbers
+        is_valid = any(
+            magic_num in header 
+            for magic_num in STEP_MAGIC_NUMBERS
+        )
         
-        except IOError as e:
-            raise InvalidFileTypeError(f"Cannot read file for validation: {str(e)}")
+        if not is_valid:
+            raise InvalidFileTypeError(
+                "File content does not match STEP format. "
+                "Please upload a valid STEP/IGES file."
+            )
     
-    def validate_file(self, file_path: str, filename: str) -> Tuple[str, int]:
+    def validate_file(self, first_chunk: bytes, total_size: int, filename: str) -> Tuple[str, int]:
         """
         Perform complete file validation
         
+        Works on the in-memory start of the upload, so nothing is read back
+        from disk
+        
         Args:
-            file_path: Path to uploaded file
+            first_chunk: Leading bytes of the upload (at least the first 512 when available)
+            total_size: Number of bytes received so far
             filename: Original filename
             
         Returns:
@@ -124,11 +125,10 @@ class FileValidator:
         file_ext = self.validate_file_extension(filename)
         
         # 2. Validate size
-        self.validate_file_size(file_path)
+        self.validate_size(total_size)
         
         # 3. Validate magic number (content)
-        self.validate_magic_number(file_path)
+        self.validate_header(first_chunk)
         
         # Return validated info
-        file_size = os.path.getsize(file_path)
-        return file_ext, file_size
+        return file_ext, total_size